@@ -5,11 +5,13 @@ from .markers import markers
 from .data import AData
 from .canvas import ACanvas
 from .figure import AFigure
+from .grid import AGrid
+from .cache import ARenderCache
 from .plot import (plot, steppify, stemify, hist, hist2d, imshow, 
                   percentile_imshow, stem, step, bar, interactive, svg_export)
 
 __all__ = [
-    'markers', 'ACanvas', 'AData', 'AFigure', 'hist', 'hist2d', 
+    'markers', 'ACanvas', 'AData', 'AFigure', 'AGrid', 'ARenderCache', 'hist', 'hist2d', 
     'imshow', 'percentile_imshow', 'plot', 'stem', 'stemify', 'step', 
     'steppify', 'bar', 'interactive', 'svg_export', '__version__', '__author__'
 ]
\ No newline at end of file
@@ -0,0 +1,173 @@
+"""Plot numbers read from stdin or files, e.g. ``seq 100 | python -m ascii_plotter``"""
+import argparse
+import io
+import os
+import stat
+import sys
+import time
+import warnings
+from collections import deque
+from typing import Tuple
+
+import numpy as np
+
+CHUNK_SIZE = 1 << 22
+FOLLOW_CHUNK_SIZE = 1 << 16
+FOLLOW_POLL_INTERVAL = 0.5
+
+def _skip_lines(buf: bytes, nlines: int) -> Tuple[bytes, int]:
+    """Drop up to ``nlines`` leading lines, returning the rest and the lines still to skip"""
+    pos = 0
+    while nlines and pos < len(buf):
+        nl = buf.find(b'\n', pos)
+        pos = len(buf) if nl < 0 else nl + 1
+        nlines -= 1
+    return buf[pos:], nlines
+
+def _parse_chunk(buf: bytes, usecols, delimiter) -> np.ndarray:
+    if not buf.strip():
+        return np.empty((0, len(usecols) if usecols else 0))
+    with warnings.catch_warnings():
+        # comment-only chunks are expected, mostly with --follow
+        warnings.filterwarnings('ignore', message='.*input contained no data')
+        return np.loadtxt(io.BytesIO(buf), delimiter=delimiter, usecols=usecols,
+                          comments='#', ndmin=2)
+
+def _iter_chunks(fd: int, chunk_size: int = CHUNK_SIZE, poll_interval: float = None):
+    """Yield blocks of complete lines, reading ``fd`` as data becomes available
+
+    With ``poll_interval`` set, end of file is not the end of input: reading is
+    retried after sleeping, like ``tail -f``.
+    """
+    tail = b''
+    while True:
+        block = os.read(fd, chunk_size)
+        if not block:
+            if poll_interval is None:
+                break
+            time.sleep(poll_interval)
+            continue
+        block = tail + block
+        cut = block.rfind(b'\n') + 1
+        tail = block[cut:]
+        if cut:
+            yield block[:cut]
+    if tail:
+        yield tail
+
+def read_columns(fd: int, usecols=None, delimiter=None, skiprows: int = 0) -> np.ndarray:
+    parts = []
+    for chunk in _iter_chunks(fd):
+        chunk, skiprows = _skip_lines(chunk, skiprows)
+        part = _parse_chunk(chunk, usecols, delimiter)
+        if part.size:
+            parts.append(part)
+    if not parts:
+        return np.empty((0, 0))
+    return np.concatenate(parts)
+
+def _render(args, data: np.ndarray, cache=None):
+    from .plot import plot, hist, imshow, bar
+    shape = (args.width, args.height)
+    if args.mode == 'imshow':
+        imshow(data.T, width=args.width, height=args.height)
+        return
+    if data.shape[1] > 1:
+        x, y = data[:, 0], data[:, 1]
+    else:
+        x, y = np.arange(len(data), dtype=float), data[:, 0]
+    if args.mode == 'hist':
+        hist(y, bins=args.bins, shape=shape, histtype='stem', cache=cache)
+    elif args.mode == 'bar':
+        bar(x, y, shape=shape, cache=cache)
+    else:
+        plot(x, y, marker=args.marker, shape=shape, plot_slope=args.slope, cache=cache)
+
+def _follow(args, fd: int, chunk_size: int = FOLLOW_CHUNK_SIZE):
+    window = deque(maxlen=args.window)
+    skiprows = args.skiprows
+    # a pipe is done at EOF, a regular file may still grow
+    poll = FOLLOW_POLL_INTERVAL if stat.S_ISREG(os.fstat(fd).st_mode) else None
+    for chunk in _iter_chunks(fd, chunk_size, poll):
+        chunk, skiprows = _skip_lines(chunk, skiprows)
+        part = _parse_chunk(chunk, args.columns, args.delimiter)
+        window.extend(part)
+        if window:
+            sys.stdout.write('\x1b[H\x1b[J')
+            _render(args, np.array(window))
+            sys.stdout.flush()
+
+def _columns(value: str):
+    try:
+        return [int(c) for c in value.split(',')]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected comma separated integers, got {value!r}")
+
+def _parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m ascii_plotter',
+                                     description='Plot columns of numbers in the terminal.')
+    parser.add_argument('files', nargs='*', help='input files (default: stdin)')
+    parser.add_argument('-m', '--mode', choices=('plot', 'hist', 'imshow', 'bar'), default='plot')
+    parser.add_argument('-c', '--columns', type=_columns, default=None,
+                        help='comma separated 0-based columns to use, e.g. "0,2"')
+    parser.add_argument('-d', '--delimiter', default=None, help='column delimiter (default: whitespace)')
+    parser.add_argument('--skiprows', type=int, default=0, help='number of header lines to skip')
+    parser.add_argument('-W', '--width', type=int, default=80)
+    parser.add_argument('-H', '--height', type=int, default=20)
+    parser.add_argument('--marker', default='_.')
+    parser.add_argument('--slope', action='store_true', help='draw line segments between points')
+    parser.add_argument('--bins', type=int, default=10)
+    parser.add_argument('-f', '--follow', action='store_true',
+                        help='re-render a sliding window as new lines arrive; '
+                             'a file argument is polled for appended lines like tail -f')
+    parser.add_argument('--window', type=int, default=1000, help='number of rows kept with --follow')
+    parser.add_argument('--cache', nargs='?', const='', default=None, metavar='DIR',
+                        help='reuse renders from an on-disk cache (default DIR: ~/.cache/ascii_plotter)')
+    return parser.parse_args(argv)
+
+def _run(args):
+    if args.follow and len(args.files) > 1:
+        raise SystemExit("--follow accepts at most one input")
+    try:
+        if args.follow:
+            if args.files:
+                with open(args.files[0], 'rb') as f:
+                    _follow(args, f.fileno())
+            else:
+                _follow(args, sys.stdin.fileno())
+            return
+        if args.files:
+            parts = []
+            for fname in args.files:
+                with open(fname, 'rb') as f:
+                    part = read_columns(f.fileno(), args.columns, args.delimiter, args.skiprows)
+                if part.size:
+                    parts.append(part)
+            data = np.concatenate(parts) if parts else np.empty((0, 0))
+        else:
+            data = read_columns(sys.stdin.fileno(), args.columns, args.delimiter, args.skiprows)
+    except ValueError as e:
+        raise SystemExit(str(e))
+    if not data.size:
+        raise SystemExit("no data to plot")
+    cache = None
+    if args.cache is not None:
+        from .cache import ARenderCache
+        cache = ARenderCache(args.cache or None)
+    _render(args, data, cache)
+    sys.stdout.flush()
+
+def main(argv=None):
+    args = _parse_args(argv)
+    try:
+        _run(args)
+    except BrokenPipeError:
+        # the reader went away (e.g. ``| head``); exit quietly like other shell filters
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        raise SystemExit(1)
+    except KeyboardInterrupt:
+        raise SystemExit(130)
+
+if __name__ == '__main__':
+    main()
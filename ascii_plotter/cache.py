@@ -0,0 +1,130 @@
+import hashlib
+import os
+import tempfile
+import time
+from typing import Iterable, Optional
+
+import numpy as np
+
+from . import __version__
+
+def _default_path() -> str:
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'ascii_plotter')
+
+def _update_buffer(h, values: Iterable):
+    try:
+        arr = np.asarray(values)
+    except (TypeError, ValueError, OverflowError):
+        arr = None
+    # only native numeric dtypes hash exactly; big ints, Decimal, Fraction go through repr
+    if arr is not None and arr.dtype.kind in 'biuf':
+        h.update(arr.dtype.str.encode('ascii'))
+        h.update(arr.tobytes())
+    else:
+        h.update(repr(list(values)).encode('utf-8'))
+
+class ARenderCache:
+    """On-disk cache of rendered figures, content-addressed by data and layout.
+
+    Entries are written to a temporary file and atomically renamed into place,
+    so several processes may share one directory. The file mtime records the
+    last access and the oldest entries are evicted once ``max_bytes`` is exceeded.
+    Temporary files left behind by killed writers count towards ``max_bytes`` and
+    are removed once older than ``stale_seconds``.
+    """
+    suffix = '.txt'
+    tmp_suffix = '.tmp'
+    stale_seconds = 3600
+
+    def __init__(self, path: str = None, max_bytes: int = 16 * 1024 * 1024):
+        self.path = path or _default_path()
+        self.max_bytes = max_bytes
+        os.makedirs(self.path, exist_ok=True)
+
+    def key(self, fig) -> str:
+        canvas = fig.canvas
+        h = hashlib.blake2b(digest_size=20)
+        header = (__version__, tuple(canvas.shape), tuple(canvas.margins),
+                  tuple(canvas._xlim), tuple(canvas._ylim), canvas.margin_factor, fig.draw_axes,
+                  fig.plot_labels, fig.new_line, fig.tickSymbols,
+                  fig.x_axis_symbol, fig.y_axis_symbol, len(fig.data))
+        h.update(repr(header).encode('utf-8'))
+        for d in fig.data:
+            h.update(repr((d.marker, d.plot_slope, d.label, len(d.x), len(d.y))).encode('utf-8'))
+            _update_buffer(h, d.x)
+            _update_buffer(h, d.y)
+        return h.hexdigest()
+
+    def _file(self, key: str) -> str:
+        return os.path.join(self.path, key + self.suffix)
+
+    def get(self, key: str) -> Optional[str]:
+        fname = self._file(key)
+        try:
+            with open(fname, 'r', encoding='utf-8', newline='') as f:
+                text = f.read()
+        except OSError:
+            return None
+        try:
+            os.utime(fname)
+        except OSError:
+            pass
+        return text
+
+    def put(self, key: str, text: str):
+        fd, tmp = tempfile.mkstemp(dir=self.path, suffix=self.tmp_suffix)
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8', newline='') as f:
+                f.write(text)
+            os.replace(tmp, self._file(key))
+        except BaseException:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+            raise
+        self._evict()
+
+    def _evict(self):
+        entries = []
+        total = 0
+        stale = time.time() - self.stale_seconds
+        with os.scandir(self.path) as it:
+            for entry in it:
+                is_tmp = entry.name.endswith(self.tmp_suffix)
+                if not is_tmp and not entry.name.endswith(self.suffix):
+                    continue
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+                if is_tmp and st.st_mtime < stale:
+                    try:
+                        os.remove(entry.path)
+                        continue
+                    except OSError:
+                        pass
+                total += st.st_size
+                if not is_tmp:
+                    entries.append((st.st_mtime, st.st_size, entry.path))
+        if total <= self.max_bytes:
+            return
+        entries.sort()
+        for _, size, fname in entries:
+            try:
+                os.remove(fname)
+            except OSError:
+                continue
+            total -= size
+            if total <= self.max_bytes:
+                break
+
+    def clear(self):
+        with os.scandir(self.path) as it:
+            for entry in it:
+                if entry.name.endswith((self.suffix, self.tmp_suffix)):
+                    try:
+                        os.remove(entry.path)
+                    except OSError:
+                        pass
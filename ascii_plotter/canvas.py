@@ -11,6 +11,8 @@ class ACanvas:
         self._xlim = list(xlim) if xlim is not None else [0, 1]
         self._ylim = list(ylim) if ylim is not None else [0, 1]
         self.auto_adjust = True
+        self.auto_xlim = True
+        self.auto_ylim = True
         self.margin_factor = 1
     @property
     def x_size(self) -> int:
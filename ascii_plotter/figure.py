@@ -11,7 +11,7 @@ class AFigure:
                  margins: Tuple[Number, Number] = (0.05, 0.1),
                  draw_axes: bool = True, newline: str = '\n',
                  plot_labels: bool = True, xlim: Sequence[Number] = None,
-                 ylim: Sequence[Number] = None):
+                 ylim: Sequence[Number] = None, cache=None):
         self.canvas = ACanvas(shape, margins, xlim, ylim)
         self.draw_axes = draw_axes
         self.new_line = newline
@@ -21,10 +21,15 @@ class AFigure:
         self.x_axis_symbol = u'\u2500'
         self.y_axis_symbol = u'\u2502'
         self.data = []
+        self.cache = cache
 
     def xlim(self, vmin: Number = None, vmax: Number = None) -> Tuple[Number, Number]:
+        if vmin is not None or vmax is not None:
+            self.canvas.auto_xlim = False
         return self.canvas.xlim(vmin, vmax)
     def ylim(self, vmin: Number = None, vmax: Number = None) -> Tuple[Number, Number]:
+        if vmin is not None or vmax is not None:
+            self.canvas.auto_ylim = False
         return self.canvas.ylim(vmin, vmax)
     def get_coord(self, val: Number, min_val: Number, step: Number, limits: Sequence[Number] = None) -> int:
         result = int((val - min_val) / step)
@@ -169,8 +174,10 @@ class AFigure:
                 max_x = max(max_x, max(ex[:2]))
                 min_y = min(min_y, min(ex[2:]))
                 max_y = max(max_y, max(ex[2:]))
-            self.canvas.xlim([min_x, max_x])
-            self.canvas.ylim([min_y, max_y])
+            if self.canvas.auto_xlim:
+                self.canvas.xlim([min_x, max_x])
+            if self.canvas.auto_ylim:
+                self.canvas.ylim([min_y, max_y])
     def append_data(self, data: AData):
         self.data.append(data)
         self.auto_limits()
@@ -211,8 +218,9 @@ class AFigure:
                 if self.canvas.coords_inside_buffer(x_pos, y_pos):
                     self.output_buffer[x_pos][y_pos] = c
 
-    def draw(self) -> str:
-        self.output_buffer = [[" "] * self.canvas.y_size for _ in range(self.canvas.x_size)]
+    def _render(self, buffer):
+        """Rasterize into ``buffer``, indexed as ``buffer[x][y]`` with y pointing up"""
+        self.output_buffer = buffer
         if self.draw_axes:
             self._draw_axes()
         for d in self.data:
@@ -220,5 +228,21 @@ class AFigure:
         if self.plot_labels:
             self._plot_labels()
             self._draw_legend()  # Added legend drawing
+
+    def draw(self) -> str:
+        if self.cache is not None:
+            key = self.cache.key(self)
+            cached = self.cache.get(key)
+            if cached is not None:
+                # nothing was rasterized, so there is no buffer matching the returned text
+                self.output_buffer = None
+                return cached
+        self._render([[" "] * self.canvas.y_size for _ in range(self.canvas.x_size)])
         trans = _transpose(_y_reverse(self.output_buffer))
-        return self.new_line.join("".join(row) for row in trans)
\ No newline at end of file
+        result = self.new_line.join("".join(row) for row in trans)
+        if self.cache is not None:
+            try:
+                self.cache.put(key, result)
+            except OSError:
+                pass
+        return result
\ No newline at end of file
@@ -0,0 +1,74 @@
+from .figure import AFigure
+from typing import Tuple, Union
+
+Number = Union[int, float]
+
+class AGrid:
+    def __init__(self, nrows: int = 1, ncols: int = 1,
+                 shape: Tuple[Number, Number] = (40, 12),
+                 margins: Tuple[Number, Number] = (0.05, 0.1),
+                 draw_axes: bool = True, newline: str = '\n',
+                 plot_labels: bool = True, hspace: int = 1, wspace: int = 2,
+                 sharex: bool = False, sharey: bool = False):
+        self.nrows = nrows
+        self.ncols = ncols
+        self.shape = shape
+        self.hspace = hspace
+        self.wspace = wspace
+        self.sharex = sharex
+        self.sharey = sharey
+        self.new_line = newline
+        self.figures = [[AFigure(shape=shape, margins=margins, draw_axes=draw_axes,
+                                 newline=newline, plot_labels=plot_labels)
+                         for _ in range(ncols)] for _ in range(nrows)]
+
+    def __getitem__(self, index) -> AFigure:
+        if isinstance(index, tuple):
+            row, col = index
+            return self.figures[row][col]
+        return self.figures[index // self.ncols][index % self.ncols]
+
+    def __iter__(self):
+        for row in self.figures:
+            for fig in row:
+                yield fig
+
+    def _share_limits(self):
+        """Compute linked limits once over all panels and apply them to each canvas
+
+        Panels whose limits were set explicitly with ``AFigure.xlim/ylim`` keep them.
+        """
+        figs = [fig for fig in self if fig.data and fig.canvas.auto_adjust]
+        if not figs:
+            return
+        extents = [d.extent() for fig in figs for d in fig.data]
+        if self.sharex:
+            xlim = [min(e[0] for e in extents), max(e[1] for e in extents)]
+            for fig in figs:
+                if fig.canvas.auto_xlim:
+                    fig.canvas.xlim(xlim)
+        if self.sharey:
+            ylim = [min(e[2] for e in extents), max(e[3] for e in extents)]
+            for fig in figs:
+                if fig.canvas.auto_ylim:
+                    fig.canvas.ylim(ylim)
+
+    def draw(self) -> str:
+        if self.sharex or self.sharey:
+            self._share_limits()
+        width, height = self.shape
+        total_width = self.ncols * width + (self.ncols - 1) * self.wspace
+        total_height = self.nrows * height + (self.nrows - 1) * self.hspace
+        rows = [[" "] * total_width for _ in range(total_height)]
+        for i, row in enumerate(self.figures):
+            top = i * (height + self.hspace) + height - 1
+            for j, fig in enumerate(row):
+                if tuple(fig.canvas.shape) != (width, height):
+                    raise ValueError(f"panel ({i}, {j}) has shape {tuple(fig.canvas.shape)}, "
+                                     f"expected the grid panel shape {(width, height)}")
+                left = j * (width + self.wspace)
+                fig._render([[" "] * height for _ in range(width)])
+                # zip(*buffer) yields the panel rows bottom-up; copy each into its slot
+                for y, line in enumerate(zip(*fig.output_buffer)):
+                    rows[top - y][left:left + width] = line
+        return self.new_line.join("".join(row) for row in rows)
@@ -4,9 +4,10 @@ from .data import AData
 import sys
 
 def plot(x, y=None, marker=None, shape=(50, 20), draw_axes=True, newline='\n',
-         plot_slope=False, x_margin=0.05, y_margin=0.1, plot_labels=True, xlim=None, ylim=None):
+         plot_slope=False, x_margin=0.05, y_margin=0.1, plot_labels=True, xlim=None, ylim=None,
+         cache=None):
     fig = AFigure(shape=shape, margins=(x_margin, y_margin), draw_axes=draw_axes,
-                  newline=newline, plot_labels=plot_labels, xlim=xlim, ylim=ylim)
+                  newline=newline, plot_labels=plot_labels, xlim=xlim, ylim=ylim, cache=cache)
     result = fig.plot(x, y, marker=marker, plot_slope=plot_slope)
     print(result)
 
@@ -27,33 +28,35 @@ def stemify(x, y):
     return xx, yy
 
 def step(x, y, shape=(50, 20), draw_axes=True, newline='\n', marker='_.',
-         plot_slope=True, x_margin=0.05, y_margin=0.1, plot_labels=True, xlim=None, ylim=None):
+         plot_slope=True, x_margin=0.05, y_margin=0.1, plot_labels=True, xlim=None, ylim=None,
+         cache=None):
     _x, _y = steppify(x, y)
     plot(_x, _y, shape=shape, draw_axes=draw_axes, newline=newline, marker=marker,
          plot_slope=plot_slope, x_margin=x_margin, y_margin=y_margin,
-         plot_labels=plot_labels, xlim=xlim, ylim=ylim)
+         plot_labels=plot_labels, xlim=xlim, ylim=ylim, cache=cache)
 
 def stem(x, y, shape=(50, 20), draw_axes=True, newline='\n', marker='_.',
-         plot_slope=True, x_margin=0.05, y_margin=0.1, plot_labels=True, xlim=None, ylim=None):
+         plot_slope=True, x_margin=0.05, y_margin=0.1, plot_labels=True, xlim=None, ylim=None,
+         cache=None):
     _x, _y = stemify(x, y)
     plot(_x, _y, shape=shape, draw_axes=draw_axes, newline=newline, marker=marker,
          plot_slope=plot_slope, x_margin=x_margin, y_margin=y_margin,
-         plot_labels=plot_labels, xlim=xlim, ylim=ylim)
+         plot_labels=plot_labels, xlim=xlim, ylim=ylim, cache=cache)
 
 def hist(x, bins=10, normed=False, weights=None, density=None, histtype='stem',
          shape=(50, 20), draw_axes=True, newline='\n', marker='_.', plot_slope=False,
-         x_margin=0.05, y_margin=0.1, plot_labels=True, xlim=None, ylim=None):
+         x_margin=0.05, y_margin=0.1, plot_labels=True, xlim=None, ylim=None, cache=None):
     n, b = np.histogram(x, bins=bins, range=xlim, density=density, weights=weights)
     _x = 0.5 * (b[:-1] + b[1:])
     if histtype == 'step':
-        step(_x, n.astype(float), shape, draw_axes, newline, marker, plot_slope, x_margin, y_margin, plot_labels, xlim, ylim)
+        step(_x, n.astype(float), shape, draw_axes, newline, marker, plot_slope, x_margin, y_margin, plot_labels, xlim, ylim, cache)
     elif histtype == 'stem':
-        stem(_x, n.astype(float), shape, draw_axes, newline, marker, plot_slope, x_margin, y_margin, plot_labels, xlim, ylim)
+        stem(_x, n.astype(float), shape, draw_axes, newline, marker, plot_slope, x_margin, y_margin, plot_labels, xlim, ylim, cache)
     else:
         y_vals = n.astype(float)
         plot(_x, y_vals, shape=shape, draw_axes=draw_axes, newline=newline, marker=marker,
              plot_slope=plot_slope, x_margin=x_margin, y_margin=y_margin,
-             plot_labels=plot_labels, xlim=xlim, ylim=ylim)
+             plot_labels=plot_labels, xlim=xlim, ylim=ylim, cache=cache)
 
 def hist2d(x, y, bins=[50,20], range=None, normed=False, weights=None, ncolors=16, width=50, percentiles=None):
     im, ex, ey = np.histogram2d(x, y, bins=bins, range=range, density=normed, weights=weights)
@@ -71,10 +74,14 @@ def percentile_imshow(im, levels=[68,95,99], extent=None, width=50, ncolors=16):
         _im[_im <= 0.01 * lk] = n - e
     imshow(1. - _im, extent=None, width=width, ncolors=ncolors)
 
-def imshow(im, extent=None, width=50, ncolors=16):
+def imshow(im, extent=None, width=50, ncolors=16, height=None):
     from scipy import ndimage
     width0 = im.shape[0]
-    _im = ndimage.zoom(im.astype(float), float(width)/float(width0))
+    if height is None:
+        zoom = float(width)/float(width0)
+    else:
+        zoom = (float(width)/float(width0), float(height)/float(im.shape[1])) + (1,) * (im.ndim - 2)
+    _im = ndimage.zoom(im.astype(float), zoom)
     _im -= im.min()
     _im /= _im.max()
     width, height = _im.shape[:2]
@@ -1,7 +1,7 @@
 import numpy as np
 import pytest
 from ascii_plotter import (
-    AData, AFigure, plot, bar, svg_export, 
+    AData, AFigure, AGrid, ARenderCache, plot, bar, svg_export, 
     steppify, stemify, hist, imshow
 )
 import tempfile
@@ -55,6 +55,281 @@ def test_AFigure_draw():
     assert isinstance(out, str)
     assert "\u253C" in out
 
+def test_AGrid_matches_single_figures():
+    grid = AGrid(1, 2, shape=(30, 10), wspace=3)
+    grid[0, 0].append_data(AData([0, 1, 2], [0, 1, 4]))
+    grid[1].append_data(AData([0, 1, 2], [2, 1, 0], marker='*'))
+    out = grid.draw()
+    left = AFigure(shape=(30, 10))
+    left.append_data(AData([0, 1, 2], [0, 1, 4]))
+    right = AFigure(shape=(30, 10))
+    right.append_data(AData([0, 1, 2], [2, 1, 0], marker='*'))
+    expected = [l + "   " + r for l, r in zip(left.draw().split("\n"), right.draw().split("\n"))]
+    assert out.split("\n") == expected
+    assert isinstance(grid[0, 0].output_buffer, list)
+    assert len(grid[0, 0].output_buffer) == 30
+
+def test_AGrid_sharey():
+    grid = AGrid(2, 1, shape=(30, 10), hspace=1, sharey=True)
+    grid[0].append_data(AData([0, 1], [0, 1]))
+    grid[1].append_data(AData([0, 1], [0, 10]))
+    lines = grid.draw().split("\n")
+    assert len(lines) == 21
+    assert lines[10].strip() == ""
+    assert grid[0].canvas.ylim() == grid[1].canvas.ylim()
+
+def test_AGrid_share_keeps_explicit_limits():
+    grid = AGrid(1, 2, shape=(30, 10), sharex=True)
+    grid[0].append_data(AData([0, 6], [0, 1]))
+    grid[1].append_data(AData([0, 1], [0, 1]))
+    grid[0].xlim(-100, 100)
+    explicit = list(grid[0].canvas.xlim())
+    grid.draw()
+    assert grid[0].canvas.xlim() == explicit
+    assert grid[1].canvas.xlim()[1] > 6
+
+def test_AGrid_panel_shape_mismatch():
+    grid = AGrid(1, 2, shape=(30, 10))
+    grid.figures[0][1] = AFigure(shape=(10, 3))
+    with pytest.raises(ValueError, match="panel \\(0, 1\\)"):
+        grid.draw()
+
+def test_render_cache(tmp_path):
+    cache = ARenderCache(str(tmp_path))
+    fig = AFigure(shape=(30, 10), cache=cache)
+    fig.append_data(AData([0, 1, 2], [0, 1, 4]))
+    out = fig.draw()
+    assert len(list(tmp_path.glob("*.txt"))) == 1
+    fig2 = AFigure(shape=(30, 10), cache=cache)
+    fig2.append_data(AData([0, 1, 2], [0, 1, 4]))
+    assert cache.get(cache.key(fig2)) == out
+    fig2.append_data(AData([3], [5]))
+    assert cache.get(cache.key(fig2)) is None
+
+def test_render_cache_hit_returns_cached_text(tmp_path):
+    cache = ARenderCache(str(tmp_path))
+    fig = AFigure(shape=(30, 10), cache=cache)
+    fig.append_data(AData([0, 1, 2], [0, 1, 4]))
+    cache.put(cache.key(fig), "SENTINEL")
+    assert fig.draw() == "SENTINEL"
+
+def test_render_cache_margin_factor_misses(tmp_path):
+    cache = ARenderCache(str(tmp_path))
+    fig = AFigure(shape=(30, 10), cache=cache)
+    fig.append_data(AData([0, 1, 2], [0, 1, 4]))
+    fig.draw()
+    fig.canvas.margin_factor = 3
+    assert cache.get(cache.key(fig)) is None
+    fig.cache = None
+    expected = fig.draw()
+    fig.cache = cache
+    assert fig.draw() == expected
+
+def test_render_cache_failed_write(tmp_path, monkeypatch):
+    import errno
+    import tempfile as _tempfile
+    def full_disk(*args, **kwargs):
+        raise OSError(errno.ENOSPC, "No space left on device")
+    cache = ARenderCache(str(tmp_path))
+    fig = AFigure(shape=(30, 10), cache=cache)
+    fig.append_data(AData([0, 1, 2], [0, 1, 4]))
+    monkeypatch.setattr(_tempfile, "mkstemp", full_disk)
+    out = fig.draw()
+    assert out.strip() != ""
+    assert list(tmp_path.glob("*.txt")) == []
+
+def test_render_cache_hit_resets_output_buffer(tmp_path):
+    cache = ARenderCache(str(tmp_path))
+    fig = AFigure(shape=(30, 10), cache=cache)
+    fig.append_data(AData([0, 1, 2], [0, 1, 4]))
+    fig.draw()
+    assert fig.output_buffer is not None
+    fig.draw()
+    assert fig.output_buffer is None
+
+def test_render_cache_exact_keys(tmp_path):
+    from fractions import Fraction
+    cache = ARenderCache(str(tmp_path))
+    def key(x):
+        fig = AFigure(shape=(30, 10))
+        fig.append_data(AData(x, [0, 1]))
+        return cache.key(fig)
+    assert key([0, 2**53]) != key([0, 2**53 + 1])
+    assert key([0, 2**70]) != key([0, 2**70 + 1])
+    assert key([Fraction(0), Fraction(1, 3)]) != key([Fraction(0), Fraction(1, 3) + Fraction(1, 2**60)])
+
+def test_render_cache_stale_tmp_files(tmp_path):
+    import os
+    cache = ARenderCache(str(tmp_path), max_bytes=100)
+    fresh = tmp_path / "fresh.tmp"
+    fresh.write_text("x" * 80)
+    stale = tmp_path / "stale.tmp"
+    stale.write_text("x" * 80)
+    old = stale.stat().st_mtime - 2 * cache.stale_seconds
+    os.utime(stale, (old, old))
+    cache.put("k0", "x" * 30)
+    cache.put("k1", "x" * 30)
+    assert not stale.exists()
+    assert fresh.exists()
+    assert sum(f.stat().st_size for f in tmp_path.iterdir()) <= 100
+    cache.clear()
+    assert list(tmp_path.iterdir()) == []
+
+def test_cli_cache(tmp_path, capsys):
+    from ascii_plotter.__main__ import main
+    data = tmp_path / "data.txt"
+    data.write_text("".join("%d\n" % (i * i) for i in range(20)))
+    cache_dir = tmp_path / "cache"
+    main([str(data), "--cache", str(cache_dir), "-W", "30", "-H", "10"])
+    first = capsys.readouterr().out
+    assert len(list(cache_dir.glob("*.txt"))) == 1
+    main([str(data), "--cache", str(cache_dir), "-W", "30", "-H", "10"])
+    assert capsys.readouterr().out == first
+
+def test_render_cache_read_only_hit(tmp_path, monkeypatch):
+    import os
+    cache = ARenderCache(str(tmp_path))
+    cache.put("k", "text")
+    def read_only(*args, **kwargs):
+        raise PermissionError("read-only file system")
+    monkeypatch.setattr(os, "utime", read_only)
+    assert cache.get("k") == "text"
+
+def test_render_cache_eviction(tmp_path):
+    cache = ARenderCache(str(tmp_path), max_bytes=100)
+    for i in range(5):
+        cache.put("k%d" % i, "x" * 40)
+    assert sum(f.stat().st_size for f in tmp_path.glob("*.txt")) <= 100
+    assert cache.get("k4") == "x" * 40
+
+def test_cli_columns(tmp_path, capsys):
+    from ascii_plotter.__main__ import main
+    data = tmp_path / "data.csv"
+    data.write_text("x,y\n" + "".join("%d,%d\n" % (i, i * i) for i in range(20)))
+    main([str(data), "-d", ",", "--skiprows", "1", "-c", "0,1", "-W", "30", "-H", "10"])
+    captured = capsys.readouterr().out
+    assert "\u2218" in captured
+    assert len(captured.rstrip("\n").split("\n")) == 10
+
+def _pipe_with(data):
+    import os
+    r, w = os.pipe()
+    os.write(w, data)
+    os.close(w)
+    return r
+
+def test_cli_iter_chunks_boundaries():
+    import os
+    from ascii_plotter.__main__ import _iter_chunks
+    fd = _pipe_with(b"1 2\n30 40\n5 6")
+    chunks = list(_iter_chunks(fd, chunk_size=4))
+    os.close(fd)
+    assert all(c.endswith(b"\n") for c in chunks[:-1])
+    assert b"".join(chunks) == b"1 2\n30 40\n5 6"
+    assert chunks[-1] == b"5 6"
+
+def test_cli_read_columns_no_trailing_newline():
+    import os
+    from ascii_plotter.__main__ import read_columns
+    fd = _pipe_with(b"# header\n1 2\n3 4")
+    data = read_columns(fd, usecols=[1])
+    os.close(fd)
+    assert data.tolist() == [[2.0], [4.0]]
+
+def test_cli_follow_skiprows_across_chunks(capsys):
+    import os
+    from ascii_plotter.__main__ import _follow, _parse_args
+    args = _parse_args(["-f", "-d", ",", "--skiprows", "2", "-W", "20", "-H", "5"])
+    fd = _pipe_with(b"t,v\nh2,h2\n1,2\n2,5\n")
+    _follow(args, fd, chunk_size=4)
+    os.close(fd)
+    captured = capsys.readouterr()
+    assert "\x1b[H\x1b[J" in captured.out
+    assert captured.err == ""
+
+def test_cli_stdin(monkeypatch, capsys):
+    import os
+    from ascii_plotter.__main__ import main
+    fd = _pipe_with(b"".join(b"%d\n" % i for i in range(20)))
+    monkeypatch.setattr(sys, "stdin", os.fdopen(fd, "rb"))
+    main(["-W", "30", "-H", "10"])
+    assert "\u2218" in capsys.readouterr().out
+
+@pytest.mark.parametrize("mode", ["plot", "hist", "bar", "imshow"])
+def test_cli_modes(mode, tmp_path, capsys):
+    from ascii_plotter.__main__ import main
+    data = tmp_path / "data.txt"
+    data.write_text("".join("%d %d %d\n" % (i, (i * 7) % 11, i % 3) for i in range(20)))
+    main([str(data), "-m", mode, "-W", "20", "-H", "8"])
+    assert capsys.readouterr().out.strip() != ""
+
+def test_cli_imshow_respects_height(monkeypatch, capsys):
+    import os
+    from ascii_plotter.__main__ import main
+    fd = _pipe_with(b"".join(b"%d\n" % i for i in range(200)))
+    monkeypatch.setattr(sys, "stdin", os.fdopen(fd, "rb"))
+    main(["-m", "imshow", "-W", "40", "-H", "10"])
+    lines = [l for l in capsys.readouterr().out.split("\n") if l]
+    assert len(lines) == 10
+    assert all(len(l) == 40 for l in lines)
+
+def test_cli_follow_polls_regular_file(tmp_path, monkeypatch, capsys):
+    import ascii_plotter.__main__ as cli
+    data = tmp_path / "live.txt"
+    data.write_text("1\n2\n")
+    calls = []
+    def fake_sleep(seconds):
+        calls.append(seconds)
+        if len(calls) == 1:
+            with open(data, "a") as f:
+                f.write("3\n")
+        else:
+            raise KeyboardInterrupt
+    monkeypatch.setattr(cli.time, "sleep", fake_sleep)
+    with pytest.raises(SystemExit) as exc:
+        cli.main(["-f", str(data), "-W", "20", "-H", "5"])
+    assert exc.value.code == 130
+    assert capsys.readouterr().out.count("\x1b[H\x1b[J") == 2
+
+def test_cli_bad_columns_is_usage_error(capsys):
+    from ascii_plotter.__main__ import main
+    with pytest.raises(SystemExit) as exc:
+        main(["-c", "x"])
+    assert exc.value.code == 2
+    assert "comma separated integers" in capsys.readouterr().err
+
+@pytest.mark.parametrize("content", ["1\nabc\n", "1 2\n3\n"])
+def test_cli_bad_input_exits_cleanly(content, tmp_path):
+    from ascii_plotter.__main__ import main
+    data = tmp_path / "bad.txt"
+    data.write_text(content)
+    with pytest.raises(SystemExit) as exc:
+        main([str(data)])
+    assert isinstance(exc.value.code, str)
+
+@pytest.mark.skipif(sys.platform.startswith("win"), reason="relies on SIGPIPE semantics")
+def test_cli_broken_pipe():
+    import os
+    import subprocess
+    root = os.path.dirname(os.path.abspath(__file__))
+    proc = subprocess.Popen([sys.executable, "-m", "ascii_plotter", "-W", "3000", "-H", "100"],
+                            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                            cwd=root)
+    proc.stdin.write(b"".join(b"%d\n" % i for i in range(1000)))
+    proc.stdin.close()
+    proc.stdout.read(10)
+    proc.stdout.close()
+    err = proc.stderr.read()
+    proc.wait()
+    assert b"Traceback" not in err
+
+def test_cli_no_data(tmp_path):
+    from ascii_plotter.__main__ import main
+    data = tmp_path / "empty.txt"
+    data.write_text("# nothing here\n")
+    with pytest.raises(SystemExit, match="no data to plot"):
+        main([str(data)])
+
 def test_steppify():
     x = np.array([0, 1, 2, 3])
     y = np.array([0, 1, 0, 1])